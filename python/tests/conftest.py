@@ -0,0 +1,23 @@
+import os
+
+# When the tests are distributed with pytest-xdist, each worker should use a single
+# thread to not oversubscribe the CPU cores. The variables are read by OpenMP, MKL,
+# and OpenBLAS when the libraries are loaded, so they must be set before numpy,
+# torch, or ctranslate2 are imported.
+if "PYTEST_XDIST_WORKER" in os.environ:
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[name] = "1"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the tests of a group in the same worker"
+    )
+
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        try:
+            import torch
+        except ImportError:
+            pass
+        else:
+            torch.set_num_threads(1)
@@ -1,3 +1,4 @@
+import copy
 import os
 import shutil
 
@@ -7,16 +8,146 @@ import test_utils
 
 import ctranslate2
 
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
 
-@pytest.fixture
-def clear_transformers_cache():
-    """Clears the Transformers model cache after each test when running in a CI."""
-    import transformers
 
+@pytest.fixture(scope="session")
+def clear_transformers_cache():
+    """Clears the Transformers model cache at the end of the session when
+    the environment variable CT2_CLEAR_HF_CACHE is set to 1.
+    """
     yield
 
-    if os.environ.get("CI") == "true":
-        shutil.rmtree(transformers.utils.default_cache_path)
+    if os.environ.get("CT2_CLEAR_HF_CACHE") == "1":
+        shutil.rmtree(transformers.utils.default_cache_path, ignore_errors=True)
+
+
+_CONVERTED_MODELS = {}
+
+
+@pytest.fixture(scope="session")
+def converted_model(request, tmp_path_factory):
+    """Converts the Transformers model given as parameter and returns the output directory.
+
+    The conversion is only run once per model and the result is reused by all tests
+    of the session.
+    """
+    model_name = request.param
+    output_dir = _CONVERTED_MODELS.get(model_name)
+    if output_dir is None:
+        converter = ctranslate2.converters.TransformersConverter(model_name)
+        # The name is unique per model and the conversion runs once, so the
+        # directory does not need a numbered suffix.
+        model_slug = model_name.replace("/", "--")
+        output_dir = tmp_path_factory.mktemp(model_slug, numbered=False)
+        output_dir = converter.convert(str(output_dir / "ctranslate2_model"))
+        _CONVERTED_MODELS[model_name] = output_dir
+    return output_dir
+
+
+def _make_model_loader(model_cls):
+    cache = {}
+
+    def _load(model_path, **kwargs):
+        key = (model_path, frozenset(kwargs.items()))
+        model = cache.get(key)
+        if model is None:
+            model = cache[key] = model_cls(model_path, **kwargs)
+        return model
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def translator_for():
+    """Returns a function creating a Translator that is shared by all tests of the session."""
+    return _make_model_loader(ctranslate2.Translator)
+
+
+@pytest.fixture(scope="session")
+def generator_for():
+    """Returns a function creating a Generator that is shared by all tests of the session."""
+    return _make_model_loader(ctranslate2.Generator)
+
+
+@pytest.fixture(scope="session")
+def hf_gpt2():
+    return transformers.GPT2LMHeadModel.from_pretrained("gpt2").eval()
+
+
+@pytest.fixture(scope="session")
+def hf_gpt2_tokenizer():
+    return transformers.AutoTokenizer.from_pretrained("gpt2")
+
+
+@pytest.fixture(scope="session")
+def hf_gpt2_on_device(hf_gpt2):
+    """Returns a function getting the GPT-2 model on a device.
+
+    The weights are copied at most once per device.
+    """
+    models = {"cpu": hf_gpt2}
+
+    def _get(device):
+        model = models.get(device)
+        if model is None:
+            model = models[device] = copy.deepcopy(hf_gpt2).to(device)
+        return model
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def gpt2_ref_output(hf_gpt2_on_device, hf_gpt2_tokenizer):
+    """Returns a function computing the reference GPT-2 output with Transformers.
+
+    The output is computed once per text, device, and return_log_probs value and is
+    then reused by the other parametrized variants.
+    """
+    outputs = {}
+
+    def _get(text, device, return_log_probs):
+        key = (tuple(text), device, return_log_probs)
+        ref_output = outputs.get(key)
+        if ref_output is None:
+            model = hf_gpt2_on_device(device)
+            with torch.no_grad():
+                inputs = hf_gpt2_tokenizer(text, return_tensors="pt")
+                inputs.to(device)
+                output = model(**inputs)
+                ref_output = output.logits
+                if return_log_probs:
+                    ref_output = torch.nn.functional.log_softmax(ref_output, dim=-1)
+                ref_output = outputs[key] = ref_output.cpu().numpy()
+        return ref_output
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def whisper_processor():
+    return transformers.WhisperProcessor.from_pretrained("openai/whisper-tiny")
+
+
+@pytest.fixture(scope="session")
+def whisper_features(whisper_processor):
+    audio_path = os.path.join(test_utils.get_data_dir(), "audio", "mr_quilter.npy")
+    audio = np.load(audio_path)
+
+    # Pad after computing the log-Mel spectrogram to match the openai/whisper behavior.
+    inputs = whisper_processor(
+        audio, return_tensors="np", padding=False, sampling_rate=16000
+    )
+    features = inputs.input_features
+    features = np.pad(features, [(0, 0), (0, 0), (0, 3000 - features.shape[-1])])
+    return features
+
+
+@pytest.fixture(scope="session")
+def whisper_features_sv(whisper_features):
+    # The storage is on CPU and is moved by the model to the target device.
+    return ctranslate2.StorageView.from_array(whisper_features)
 
 
 _TRANSFORMERS_TRANSLATION_TESTS = [
@@ -83,47 +214,62 @@ _TRANSFORMERS_TRANSLATION_TESTS = [
     ),
     (
         "facebook/nllb-200-distilled-600M",
-        ["▁Hello ▁world ! </s> eng_Latn", "</s> eng_Latn"],
-        ["fra_Latn", "fra_Latn"],
-        ["fra_Latn ▁Bon jour ▁le ▁monde ▁!", "fra_Latn"],
+        "▁Hello ▁world ! </s> eng_Latn",
+        "fra_Latn",
+        "fra_Latn ▁Bon jour ▁le ▁monde ▁!",
+        dict(),
+    ),
+    (
+        "facebook/nllb-200-distilled-600M",
+        "</s> eng_Latn",
+        "fra_Latn",
+        "fra_Latn",
         dict(),
     ),
 ]
 
 
+def _group_translation_tests(tests):
+    """Groups the translation tests by model and options so that each group
+    can be translated with a single batch. The tokens are split once here.
+    """
+    groups = {}
+    for model, source_tokens, target_tokens, expected_tokens, kwargs in tests:
+        key = (model, tuple(sorted(kwargs.items())))
+        group = groups.setdefault(key, (model, [], [], [], kwargs))
+        group[1].append(source_tokens.split())
+        group[2].append(target_tokens.split())
+        group[3].append(expected_tokens.split())
+    return list(groups.values())
+
+
+_TRANSFORMERS_TRANSLATION_BATCHES = _group_translation_tests(
+    _TRANSFORMERS_TRANSLATION_TESTS
+)
+
+
 @test_utils.only_on_linux
 @pytest.mark.parametrize(
-    "model,source_tokens,target_tokens,expected_tokens,kwargs",
-    _TRANSFORMERS_TRANSLATION_TESTS,
-    ids=[args[0] for args in _TRANSFORMERS_TRANSLATION_TESTS],
+    "converted_model,source_tokens,target_tokens,expected_tokens,kwargs",
+    _TRANSFORMERS_TRANSLATION_BATCHES,
+    ids=[args[0] for args in _TRANSFORMERS_TRANSLATION_BATCHES],
+    indirect=["converted_model"],
 )
 def test_transformers_translation(
     clear_transformers_cache,
-    tmpdir,
-    model,
+    converted_model,
     source_tokens,
     target_tokens,
     expected_tokens,
     kwargs,
 ):
-    converter = ctranslate2.converters.TransformersConverter(model)
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-
-    if not isinstance(expected_tokens, list):
-        expected_tokens = [expected_tokens]
-    if not isinstance(source_tokens, list):
-        source_tokens = [source_tokens]
-    if target_tokens and not isinstance(target_tokens, list):
-        target_tokens = [target_tokens]
-
-    translator = ctranslate2.Translator(output_dir)
+    translator = ctranslate2.Translator(converted_model)
     results = translator.translate_batch(
-        [line.split() for line in source_tokens],
-        [line.split() for line in target_tokens] if target_tokens else None,
+        source_tokens,
+        target_tokens if any(target_tokens) else None,
         **kwargs,
     )
-    output_tokens = [" ".join(result.hypotheses[0]) for result in results]
+    output_tokens = [result.hypotheses[0] for result in results]
     assert output_tokens == expected_tokens
 
 
@@ -148,29 +294,29 @@ _TRANSFORMERS_GENERATION_TESTS = [
     ),
 ]
 
+_TRANSFORMERS_GENERATION_TESTS = [
+    (model, start_tokens.split(), max_length, expected_tokens.split())
+    for model, start_tokens, max_length, expected_tokens in _TRANSFORMERS_GENERATION_TESTS
+]
+
 
 @test_utils.only_on_linux
 @pytest.mark.parametrize(
-    "model,start_tokens,max_length,expected_tokens",
+    "converted_model,start_tokens,max_length,expected_tokens",
     _TRANSFORMERS_GENERATION_TESTS,
     ids=[args[0] for args in _TRANSFORMERS_GENERATION_TESTS],
+    indirect=["converted_model"],
 )
 def test_transformers_generation(
     clear_transformers_cache,
-    tmpdir,
-    model,
+    converted_model,
     start_tokens,
     max_length,
     expected_tokens,
 ):
-    converter = ctranslate2.converters.TransformersConverter(model)
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-
-    generator = ctranslate2.Generator(output_dir)
-    results = generator.generate_batch([start_tokens.split()], max_length=max_length)
-    output_tokens = " ".join(results[0].sequences[0])
-    assert output_tokens == expected_tokens
+    generator = ctranslate2.Generator(converted_model)
+    results = generator.generate_batch([start_tokens], max_length=max_length)
+    assert results[0].sequences[0] == expected_tokens
 
     # Test empty inputs.
     assert generator.generate_batch([]) == []
@@ -180,40 +326,34 @@ def test_transformers_generation(
 
 
 @test_utils.only_on_linux
-def test_transformers_marianmt_vocabulary(clear_transformers_cache, tmpdir):
-    converter = ctranslate2.converters.TransformersConverter(
-        "Helsinki-NLP/opus-mt-en-de"
-    )
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-
-    with open(os.path.join(output_dir, "shared_vocabulary.txt")) as vocab_file:
+@pytest.mark.parametrize(
+    "converted_model", ["Helsinki-NLP/opus-mt-en-de"], indirect=True
+)
+def test_transformers_marianmt_vocabulary(clear_transformers_cache, converted_model):
+    with open(os.path.join(converted_model, "shared_vocabulary.txt")) as vocab_file:
         vocab = list(line.rstrip("\n") for line in vocab_file)
 
     assert vocab[-1] != "<pad>"
 
 
 @test_utils.only_on_linux
+@pytest.mark.parametrize(
+    "converted_model", ["Helsinki-NLP/opus-mt-en-roa"], indirect=True
+)
 @pytest.mark.parametrize("beam_size", [1, 2])
-def test_transformers_marianmt_disable_unk(clear_transformers_cache, tmpdir, beam_size):
-    converter = ctranslate2.converters.TransformersConverter(
-        "Helsinki-NLP/opus-mt-en-roa"
-    )
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-
+def test_transformers_marianmt_disable_unk(
+    clear_transformers_cache, translator_for, converted_model, beam_size
+):
     tokens = ">>ind<< ▁The ▁Prime <unk> ▁is ▁coming ▁back ▁tomorrow . </s>".split()
-    translator = ctranslate2.Translator(output_dir)
+    translator = translator_for(converted_model)
     output = translator.translate_batch([tokens], beam_size=beam_size, disable_unk=True)
     assert "<unk>" not in output[0].hypotheses[0]
 
 
 @test_utils.only_on_linux
-def test_transformers_lm_scoring(tmpdir):
-    converter = ctranslate2.converters.TransformersConverter("gpt2")
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-    generator = ctranslate2.Generator(output_dir)
+@pytest.mark.parametrize("converted_model", ["gpt2"], indirect=True)
+def test_transformers_lm_scoring(generator_for, converted_model):
+    generator = generator_for(converted_model)
 
     tokens = "Ċ The Ġfirst Ġtime ĠI Ġsaw Ġthe Ġnew Ġversion Ġof".split()
     output = generator.score_batch([tokens])[0]
@@ -236,30 +376,21 @@ def test_transformers_lm_scoring(tmpdir):
 @test_utils.on_available_devices
 @pytest.mark.parametrize("return_log_probs", [True, False])
 @pytest.mark.parametrize("tensor_input", [True, False])
-def test_transformers_lm_forward(tmpdir, device, return_log_probs, tensor_input):
-    import torch
-    import transformers
-
-    model_name = "gpt2"
-
-    model = transformers.GPT2LMHeadModel.from_pretrained(model_name)
-    tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
-    converter = ctranslate2.converters.TransformersConverter(model_name)
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-    generator = ctranslate2.Generator(output_dir, device=device)
+@pytest.mark.xdist_group("gpu")
+@pytest.mark.parametrize("converted_model", ["gpt2"], indirect=True)
+def test_transformers_lm_forward(
+    gpt2_ref_output,
+    hf_gpt2_tokenizer,
+    converted_model,
+    device,
+    return_log_probs,
+    tensor_input,
+):
+    tokenizer = hf_gpt2_tokenizer
+    generator = ctranslate2.Generator(converted_model, device=device)
 
     text = ["Hello world!"]
-
-    with torch.no_grad():
-        inputs = tokenizer(text, return_tensors="pt")
-        inputs.to(device)
-        model.to(device)
-        output = model(**inputs)
-        ref_output = output.logits
-        if return_log_probs:
-            ref_output = torch.nn.functional.log_softmax(ref_output, dim=-1)
-        ref_output = ref_output.cpu().numpy()
+    ref_output = gpt2_ref_output(text, device, return_log_probs)
 
     kwargs = dict(return_log_probs=return_log_probs)
 
@@ -285,7 +416,7 @@ def test_transformers_lm_forward(tmpdir, device, return_log_probs, tensor_input)
         output = generator.forward_batch(ids, **kwargs)
 
     if device == "cpu":
-        output = np.array(output)
+        output = np.asarray(output)
     else:
         output = torch.as_tensor(output, device=device).cpu().numpy()
 
@@ -294,11 +425,9 @@ def test_transformers_lm_forward(tmpdir, device, return_log_probs, tensor_input)
 
 
 @test_utils.only_on_linux
-def test_transformers_generator_on_iterables(tmpdir):
-    converter = ctranslate2.converters.TransformersConverter("gpt2")
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-    generator = ctranslate2.Generator(output_dir)
+@pytest.mark.parametrize("converted_model", ["gpt2"], indirect=True)
+def test_transformers_generator_on_iterables(generator_for, converted_model):
+    generator = generator_for(converted_model)
 
     start_tokens = ["<|endoftext|>"]
     tokens = "Ċ The Ġfirst Ġtime ĠI Ġsaw Ġthe Ġnew Ġversion Ġof".split()
@@ -317,11 +446,9 @@ def test_transformers_generator_on_iterables(tmpdir):
 
 
 @test_utils.only_on_linux
-def test_transformers_generator_suppress_sequences(tmpdir):
-    converter = ctranslate2.converters.TransformersConverter("gpt2")
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-    generator = ctranslate2.Generator(output_dir)
+@pytest.mark.parametrize("converted_model", ["gpt2"], indirect=True)
+def test_transformers_generator_suppress_sequences(generator_for, converted_model):
+    generator = generator_for(converted_model)
 
     output = generator.generate_batch(
         [["<|endoftext|>"]],
@@ -336,25 +463,15 @@ def test_transformers_generator_suppress_sequences(tmpdir):
 @test_utils.only_on_linux
 @test_utils.on_available_devices
 @pytest.mark.parametrize("with_timestamps", [True, False])
-def test_transformers_whisper(tmpdir, device, with_timestamps):
-    import transformers
-
-    model_name = "openai/whisper-tiny"
-    converter = ctranslate2.converters.TransformersConverter(model_name)
-    output_dir = str(tmpdir.join("ctranslate2_model"))
-    output_dir = converter.convert(output_dir)
-
-    audio_path = os.path.join(test_utils.get_data_dir(), "audio", "mr_quilter.npy")
-    audio = np.load(audio_path)
-
-    # Pad after computing the log-Mel spectrogram to match the openai/whisper behavior.
-    processor = transformers.WhisperProcessor.from_pretrained(model_name)
-    inputs = processor(audio, return_tensors="np", padding=False, sampling_rate=16000)
-    features = inputs.input_features
-    features = np.pad(features, [(0, 0), (0, 0), (0, 3000 - features.shape[-1])])
-    features = ctranslate2.StorageView.from_array(features)
+@pytest.mark.xdist_group("gpu")
+@pytest.mark.parametrize("converted_model", ["openai/whisper-tiny"], indirect=True)
+def test_transformers_whisper(
+    whisper_processor, whisper_features_sv, converted_model, device, with_timestamps
+):
+    processor = whisper_processor
+    features = whisper_features_sv
 
-    model = ctranslate2.models.Whisper(output_dir, device=device)
+    model = ctranslate2.models.Whisper(converted_model, device=device)
 
     results = model.detect_language(features)
     best_lang, best_prob = results[0][0]